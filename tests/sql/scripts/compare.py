@@ -12,75 +12,123 @@ Comparison strategy:
 - Compare table name and column values (type-aware: "100" == 100)
 """
 
+import calendar
 import json
+import operator
 import re
 import sys
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 OLR_OP_MAP = {'c': 'INSERT', 'u': 'UPDATE', 'd': 'DELETE'}
 
-# Oracle date/timestamp patterns from LogMiner
-ORACLE_TIMESTAMP_RE = re.compile(
-    r'^(\d{2})-([A-Z]{3})-(\d{2,4})\s+(\d{1,2})\.(\d{2})\.(\d{2})(?:\.(\d+))?\s*(AM|PM)$',
+# Placeholders LogMiner writes before the LOB data arrives in a later UPDATE
+EMPTY_LOBS = frozenset(('EMPTY_CLOB()', 'EMPTY_BLOB()'))
+
+# Sentinel for dict lookups where None is a valid column value
+MISSING = object()
+
+# Records can only pair up when operation and table agree
+MATCH_KEY = operator.attrgetter('op', 'table')
+
+# JSONL inputs are read in binary with a large buffer; orjson takes bytes
+READ_BUFFER_SIZE = 1 << 20
+
+# orjson decodes integers wider than 64 bits as floats, which would hide
+# NUMBER(38) mismatches — lines with long digit runs use the stdlib parser
+LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+# Oracle date/timestamp patterns from LogMiner, all anchored:
+# DD-MON-RR[RR] [HH.MI.SS[.FF] [AM|PM]]
+ORACLE_DATETIME_RE = re.compile(
+    r'^(\d{1,2})-([A-Z]{3})-(\d{2}|\d{4})'
+    r'(?:\s+(\d{1,2})\.(\d{1,2})\.(\d{1,2})(?:\.(\d+))?\s*(AM|PM)?)?$',
     re.IGNORECASE
 )
+# YYYY-MM-DD HH24:MI:SS
+ORACLE_YMD_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})$')
 
-ORACLE_DATE_FORMATS = [
-    '%d-%b-%y',          # DD-MON-RR: 01-JAN-25
-    '%d-%b-%Y',          # DD-MON-RRRR: 01-JAN-2025
-    '%Y-%m-%d %H:%M:%S', # YYYY-MM-DD HH24:MI:SS
-    '%d-%b-%y %H.%M.%S', # DD-MON-RR HH.MI.SS (Oracle default with time)
-]
+# Strings float() accepts, minus the digit-grouping underscores LogMiner/OLR never emit
+NUMERIC_RE = re.compile(
+    r'^\s*[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|inf(?:inity)?|nan)\s*$',
+    re.IGNORECASE
+)
 
+# Drop CR, turn LF into a space: '\r\n' and '\n' become ' ', a lone '\r' vanishes
+CRLF_TO_SPACE = str.maketrans({'\r': None, '\n': ' '})
 
-def normalize_value(v):
-    """Normalize a value to string for comparison. None stays None."""
-    if v is None:
-        return None
-    return str(v)
+MON2NUM = {mon: num for num, mon in enumerate(
+    ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'), 1)}
 
 
 def normalize_columns(d):
-    """Normalize a dict of column->value to column->string."""
+    """Normalize a dict of column->value, keeping the JSON-typed values.
+    Column names are interned: they repeat on every row of a table."""
     if not d or not isinstance(d, dict):
         return {}
-    return {k: normalize_value(v) for k, v in d.items()}
+    return {sys.intern(k): v for k, v in d.items()}
+
+
+@dataclass
+class Record:
+    """One DML operation; before/after map column name -> value."""
+    # Declared by hand rather than slots=True to keep Python < 3.10 working
+    __slots__ = ('op', 'owner', 'table', 'xid', 'scn', 'before', 'after')
+    op: str
+    owner: str
+    table: str
+    xid: str
+    scn: str
+    before: dict
+    after: dict
+
+
+def json_loads(line):
+    """Decode one JSON line (bytes), using orjson when it is available."""
+    if orjson is None or LONG_DIGITS_RE.search(line):
+        return json.loads(line)
+    return orjson.loads(line)
 
 
 def parse_logminer_json(path):
-    """Parse logminer2json.py output. One JSON object per line."""
-    records = []
-    with open(path) as f:
+    """Parse logminer2json.py output. One JSON object per line.
+    Yields records one at a time."""
+    with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            obj = json.loads(line)
-            records.append({
-                'op': obj['op'],
-                'owner': obj.get('owner', ''),
-                'table': obj.get('table', ''),
-                'xid': obj.get('xid', ''),
-                'scn': obj.get('scn', ''),
-                'before': normalize_columns(obj.get('before')),
-                'after': normalize_columns(obj.get('after')),
-            })
-    return records
+            obj = json_loads(line)
+            # Low-cardinality fields are interned so equality checks in
+            # compare() short-circuit on identity
+            yield Record(
+                op=sys.intern(obj['op']),
+                owner=sys.intern(obj.get('owner', '')),
+                table=sys.intern(obj.get('table', '')),
+                xid=sys.intern(obj.get('xid', '')),
+                scn=obj.get('scn', ''),
+                before=normalize_columns(obj.get('before')),
+                after=normalize_columns(obj.get('after')),
+            )
 
 
 def parse_olr_json(path):
     """Parse OLR JSON output. One JSON object per line.
     Each line: {"scn":..., "xid":..., "payload":[{...}]}
-    Skip begin/commit/checkpoint messages."""
-    records = []
-    with open(path) as f:
+    Skip begin/commit/checkpoint messages. Yields records one at a time."""
+    with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            obj = json.loads(line)
+            obj = json_loads(line)
             payload = obj.get('payload', [])
-            xid = obj.get('xid', '')
+            xid = sys.intern(obj.get('xid', ''))
 
             for entry in payload:
                 op = entry.get('op', '')
@@ -88,22 +136,32 @@ def parse_olr_json(path):
                     continue
 
                 schema = entry.get('schema', {})
-                owner = schema.get('owner', '')
-                table = schema.get('table', '')
+                owner = sys.intern(schema.get('owner', ''))
+                table = sys.intern(schema.get('table', ''))
 
                 before = normalize_columns(entry.get('before'))
                 after = normalize_columns(entry.get('after'))
 
-                records.append({
-                    'op': OLR_OP_MAP[op],
-                    'owner': owner,
-                    'table': table,
-                    'xid': xid,
-                    'scn': str(obj.get('c_scn', '')),
-                    'before': before,
-                    'after': after,
-                })
-    return records
+                yield Record(
+                    op=OLR_OP_MAP[op],
+                    owner=owner,
+                    table=table,
+                    xid=xid,
+                    scn=str(obj.get('c_scn', '')),
+                    before=before,
+                    after=after,
+                )
+
+
+def utc_epoch(year, month, day, hour=0, minute=0, second=0):
+    """Convert UTC date/time fields to epoch seconds, None if out of range."""
+    if year < 1 or not 1 <= month <= 12:
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
 
 
 def try_parse_oracle_datetime(s):
@@ -112,57 +170,87 @@ def try_parse_oracle_datetime(s):
     Handles:
     - DATE: '15-JUN-25' (date only, midnight)
     - TIMESTAMP: '15-JUN-25 10.30.00.123456 AM' (full timestamp)
-    - Various date formats
+    - DD-MON-RR HH.MI.SS and YYYY-MM-DD HH24:MI:SS (compared as dates)
+
+    Two-digit years follow Oracle's RR rule: 00-49 → 20xx, 50-99 → 19xx.
 
     Returns (epoch_seconds, is_date_only) or (None, None) on failure.
     """
     s = s.strip()
+    # Every supported format starts with a digit — skip regex work otherwise
+    if not s or not s[0].isdigit():
+        return None, None
 
-    # Try TIMESTAMP format: DD-MON-RR HH.MI.SS[.FF] AM/PM
-    m = ORACLE_TIMESTAMP_RE.match(s)
+    m = ORACLE_DATETIME_RE.match(s)
     if m:
         day, mon, year, hour, minute, sec, frac, ampm = m.groups()
-        hour = int(hour)
-        if ampm.upper() == 'PM' and hour != 12:
-            hour += 12
-        elif ampm.upper() == 'AM' and hour == 12:
-            hour = 0
-        try:
-            dt = datetime.strptime(f"{day}-{mon}-{year}", '%d-%b-%y')
-            dt = dt.replace(hour=hour, minute=int(minute), second=int(sec),
-                            tzinfo=timezone.utc)
-            epoch = dt.timestamp()
-            if frac:
-                epoch += int(frac) / (10 ** len(frac))
-            # Round half-up (not banker's rounding) to match OLR behavior
-            return int(epoch + 0.5), False
-        except ValueError:
-            pass
-
-    # Try date-only formats
-    for fmt in ORACLE_DATE_FORMATS:
-        try:
-            dt = datetime.strptime(s, fmt)
-            dt = dt.replace(tzinfo=timezone.utc)
-            return int(dt.timestamp()), True
-        except ValueError:
-            continue
+        month = MON2NUM.get(mon.upper())
+        if month is None:
+            return None, None
+        y = int(year)
+        if len(year) == 2:
+            y += 2000 if y < 50 else 1900
+
+        if ampm is None:
+            # DATE, optionally with a 24-hour time part
+            if hour is None:
+                epoch = utc_epoch(y, month, int(day))
+            else:
+                epoch = utc_epoch(y, month, int(day), int(hour), int(minute), int(sec))
+            return (None, None) if epoch is None else (epoch, True)
+
+        # TIMESTAMP: HH.MI.SS[.FF] AM/PM
+        h = int(hour)
+        if ampm[0] in 'Pp':
+            if h != 12:
+                h += 12
+        elif h == 12:
+            h = 0
+        epoch = utc_epoch(y, month, int(day), h, int(minute), int(sec))
+        if epoch is None:
+            return None, None
+        if frac:
+            epoch += int(frac) / (10 ** len(frac))
+        # Round half-up (not banker's rounding) to match OLR behavior
+        return int(epoch + 0.5), False
+
+    m = ORACLE_YMD_RE.match(s)
+    if m:
+        epoch = utc_epoch(*map(int, m.groups()))
+        if epoch is not None:
+            return epoch, True
 
     return None, None
 
 
+@lru_cache(maxsize=4096)
+def epoch_to_date(epoch):
+    """UTC calendar date of an integer epoch; DATE columns repeat heavily."""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).date()
+
+
 def values_match(lm_val, olr_val):
-    """Compare two normalized values with type awareness."""
+    """Compare two column values with type awareness.
+
+    Values keep their JSON types: LogMiner values are strings, OLR numbers
+    arrive as int/float. Numbers are compared without a string round-trip;
+    the date and whitespace checks work on the string form.
+    """
     if lm_val is None and olr_val is None:
         return True
     if lm_val is None or olr_val is None:
         return False
-    # Direct string match
-    if lm_val == olr_val:
+    lm_type = type(lm_val)
+    olr_type = type(olr_val)
+    # Direct match
+    if lm_type is olr_type and lm_val == olr_val:
         return True
     # Try numeric comparison with tolerance for float precision differences
     # (e.g., BINARY_FLOAT: LogMiner='3.1400001E+000', OLR='3.14')
-    try:
+    # JSON numbers are used as-is (bool is not a number here); strings are
+    # screened first so non-numeric ones never raise in float()
+    if ((lm_type in (int, float) or (lm_type is str and NUMERIC_RE.match(lm_val)))
+            and (olr_type in (int, float) or (olr_type is str and NUMERIC_RE.match(olr_val)))):
         lm_f, olr_f = float(lm_val), float(olr_val)
         if lm_f == olr_f:
             return True
@@ -171,8 +259,10 @@ def values_match(lm_val, olr_val):
             return True
         if olr_f != 0 and abs(lm_f - olr_f) / abs(olr_f) < 1e-6:
             return True
-    except (ValueError, TypeError):
-        pass
+    if lm_type is not str:
+        lm_val = str(lm_val)
+    if olr_type is not str:
+        olr_val = str(olr_val)
     # Try date/timestamp comparison
     lm_epoch, lm_date_only = try_parse_oracle_datetime(lm_val)
     if lm_epoch is not None:
@@ -180,8 +270,8 @@ def values_match(lm_val, olr_val):
             olr_epoch = int(olr_val)
             if lm_date_only:
                 # LogMiner DATE format truncates time — compare date portion only
-                lm_date = datetime.fromtimestamp(lm_epoch, tz=timezone.utc).date()
-                olr_date = datetime.fromtimestamp(olr_epoch, tz=timezone.utc).date()
+                lm_date = epoch_to_date(lm_epoch)
+                olr_date = epoch_to_date(olr_epoch)
                 if lm_date == olr_date:
                     return True
             else:
@@ -195,8 +285,8 @@ def values_match(lm_val, olr_val):
         try:
             lm_epoch_int = int(lm_val)
             if olr_date_only:
-                lm_date = datetime.fromtimestamp(lm_epoch_int, tz=timezone.utc).date()
-                olr_date = datetime.fromtimestamp(olr_epoch, tz=timezone.utc).date()
+                lm_date = epoch_to_date(lm_epoch_int)
+                olr_date = epoch_to_date(olr_epoch)
                 if lm_date == olr_date:
                     return True
             else:
@@ -206,14 +296,14 @@ def values_match(lm_val, olr_val):
             pass
     # Whitespace normalization: LogMiner extraction replaces CR/LF with spaces,
     # OLR preserves the actual characters. Normalize and retry.
-    lm_ws = lm_val.replace('\r\n', ' ').replace('\n', ' ').replace('\r', '')
-    olr_ws = olr_val.replace('\r\n', ' ').replace('\n', ' ').replace('\r', '')
+    lm_ws = lm_val.translate(CRLF_TO_SPACE)
+    olr_ws = olr_val.translate(CRLF_TO_SPACE)
     if lm_ws == olr_ws:
         return True
     return False
 
 
-def columns_match(lm_cols, olr_cols, op=None, section=None):
+def columns_match(lm_cols, olr_cols):
     """Compare two column dicts.
 
     For UPDATE 'after': OLR may include supplemental log columns not in LogMiner's
@@ -221,28 +311,27 @@ def columns_match(lm_cols, olr_cols, op=None, section=None):
     For other cases: OLR may omit unchanged columns — missing OLR columns are skipped.
     """
     diffs = []
-    all_keys = set(lm_cols.keys()) | set(olr_cols.keys())
-    for key in sorted(all_keys):
-        lm_val = lm_cols.get(key)
-        olr_val = olr_cols.get(key)
-        if key not in olr_cols:
-            # OLR may omit unchanged columns in before/after — skip
-            continue
-        if key not in lm_cols:
-            # OLR may have columns LogMiner doesn't: supplemental logging adds
-            # all columns on UPDATE, and LOB data too large for SQL_REDO is
-            # absent from LogMiner output — skip in both cases
+    # Only keys present on both sides are compared: OLR may omit unchanged
+    # columns, and may carry columns LogMiner doesn't (supplemental logging
+    # adds all columns on UPDATE; LOB data too large for SQL_REDO is absent)
+    for key, olr_val in olr_cols.items():
+        lm_val = lm_cols.get(key, MISSING)
+        if lm_val is MISSING:
             continue
         if not values_match(lm_val, olr_val):
-            diffs.append(f"  column {key}: LogMiner={lm_val!r}, OLR={olr_val!r}")
-    return diffs
+            diffs.append((key, lm_val, olr_val))
+    if not diffs:
+        return []
+    diffs.sort(key=operator.itemgetter(0))
+    return [f"  column {key}: LogMiner={lm_val!r}, OLR={olr_val!r}"
+            for key, lm_val, olr_val in diffs]
 
 
 def has_empty_lobs(after):
     """Check if any column value is EMPTY_CLOB() or EMPTY_BLOB()."""
     if not after:
         return False
-    return any(v in ('EMPTY_CLOB()', 'EMPTY_BLOB()') for v in after.values() if v)
+    return any(v in EMPTY_LOBS for v in after.values())
 
 
 def normalize_lob_operations(records):
@@ -256,53 +345,37 @@ def normalize_lob_operations(records):
     Merges these into single records to match OLR's coalesced output.
     After merging, remaining EMPTY_CLOB()/EMPTY_BLOB() values (data too large
     for LogMiner SQL_REDO) are removed from the record.
+
+    Accepts any iterable of records and returns a list.
     """
     result = []
-    i = 0
-    while i < len(records):
-        rec = {
-            'op': records[i]['op'],
-            'owner': records[i]['owner'],
-            'table': records[i]['table'],
-            'xid': records[i]['xid'],
-            'scn': records[i].get('scn', ''),
-            'before': dict(records[i].get('before', {})),
-            'after': dict(records[i].get('after', {})),
-        }
-
-        while i + 1 < len(records):
-            nxt = records[i + 1]
-            if nxt['op'] != 'UPDATE' or nxt['xid'] != rec['xid'] or nxt['table'] != rec['table']:
-                break
-
-            # Pattern A/B: current has EMPTY_CLOB/EMPTY_BLOB → next fills them
-            if has_empty_lobs(rec['after']):
-                for col, val in nxt.get('after', {}).items():
-                    rec['after'][col] = val
-                i += 1
-                continue
-
-            # Pattern C: consecutive UPDATEs at same SCN (LOB column split)
-            # Only merge if after dicts have no overlapping keys — Oracle splits
-            # a single UPDATE into non-LOB + LOB parts with disjoint columns.
-            # Overlapping keys means two separate UPDATE statements.
-            nxt_after = nxt.get('after', {})
-            if (rec['op'] == 'UPDATE' and rec.get('scn') and rec['scn'] == nxt.get('scn', '')
-                    and not (set(rec['after']) & set(nxt_after))):
-                for col, val in nxt_after.items():
-                    rec['after'][col] = val
-                i += 1
-                continue
+    # Only consecutive records of the same transaction and table can merge
+    for _, group in groupby(records, key=operator.attrgetter('xid', 'table')):
+        rec = None
+        for nxt in group:
+            if rec is not None and nxt.op == 'UPDATE':
+                # Pattern A/B: current has EMPTY_CLOB/EMPTY_BLOB → next fills them
+                if has_empty_lobs(rec.after):
+                    rec.after.update(nxt.after)
+                    continue
 
-            break
+                # Pattern C: consecutive UPDATEs at same SCN (LOB column split)
+                # Only merge if after dicts have no overlapping keys — Oracle splits
+                # a single UPDATE into non-LOB + LOB parts with disjoint columns.
+                # Overlapping keys means two separate UPDATE statements.
+                if (rec.op == 'UPDATE' and rec.scn and rec.scn == nxt.scn
+                        and rec.after.keys().isdisjoint(nxt.after)):
+                    rec.after.update(nxt.after)
+                    continue
 
-        # Remove EMPTY_CLOB()/EMPTY_BLOB() values that weren't filled
-        # (LogMiner couldn't capture the data — too large for SQL_REDO)
-        rec['after'] = {k: v for k, v in rec['after'].items()
-                        if v not in ('EMPTY_CLOB()', 'EMPTY_BLOB()')}
+            rec = replace(nxt, after=dict(nxt.after))
+            result.append(rec)
 
-        result.append(rec)
-        i += 1
+    # Remove EMPTY_CLOB()/EMPTY_BLOB() values that weren't filled
+    # (LogMiner couldn't capture the data — too large for SQL_REDO)
+    for rec in result:
+        for col in [col for col, val in rec.after.items() if val in EMPTY_LOBS]:
+            del rec.after[col]
     return result
 
 
@@ -312,15 +385,13 @@ def match_score(lm, olr):
     Returns (match_count, mismatch_count) based on common column values.
     A good match has high match_count and zero mismatch_count.
     """
-    if lm['op'] != olr['op'] or lm['table'] != olr['table']:
+    if lm.op != olr.op or lm.table != olr.table:
         return (-1, 0)
 
     matches = 0
     mismatches = 0
     # Check identifying section: after for INSERT, before for DELETE/UPDATE
-    for section in ('after', 'before'):
-        lm_cols = lm.get(section, {})
-        olr_cols = olr.get(section, {})
+    for lm_cols, olr_cols in ((lm.after, olr.after), (lm.before, olr.before)):
         common_keys = set(lm_cols.keys()) & set(olr_cols.keys())
         for key in common_keys:
             if values_match(lm_cols.get(key), olr_cols.get(key)):
@@ -344,6 +415,12 @@ def compare(lm_records, olr_records):
             f"Record count mismatch: LogMiner={len(lm_records)}, OLR={len(olr_records)}"
         )
 
+    # Index OLR records by (op, table) once so each LM record only scores
+    # compatible candidates; indexes stay ascending to keep tie-breaking
+    candidates = {}
+    for j, key in enumerate(map(MATCH_KEY, olr_records)):
+        candidates.setdefault(key, []).append(j)
+
     # Build match candidates: for each LM record, find best OLR match
     used_olr = set()
     pairs = []  # (lm_idx, olr_idx)
@@ -353,10 +430,10 @@ def compare(lm_records, olr_records):
         best_matches = -1
         best_mismatches = float('inf')
 
-        for j, olr in enumerate(olr_records):
+        for j in candidates.get(MATCH_KEY(lm), ()):
             if j in used_olr:
                 continue
-            m, mm = match_score(lm, olr)
+            m, mm = match_score(lm, olr_records[j])
             if m < 0:
                 continue
             # Prefer: fewer mismatches, then more matches
@@ -370,7 +447,7 @@ def compare(lm_records, olr_records):
             pairs.append((i, best_j))
         else:
             diffs.append(
-                f"LogMiner record #{i+1} ({lm['op']} {lm['table']}): "
+                f"LogMiner record #{i+1} ({lm.op} {lm.table}): "
                 f"no matching OLR record found"
             )
 
@@ -379,7 +456,7 @@ def compare(lm_records, olr_records):
         if j not in used_olr:
             olr = olr_records[j]
             diffs.append(
-                f"OLR record #{j+1} ({olr['op']} {olr['table']}): "
+                f"OLR record #{j+1} ({olr.op} {olr.table}): "
                 f"no matching LogMiner record found"
             )
 
@@ -388,20 +465,18 @@ def compare(lm_records, olr_records):
         lm = lm_records[lm_idx]
         olr = olr_records[olr_idx]
 
-        if lm['op'] in ('INSERT', 'UPDATE'):
-            col_diffs = columns_match(lm.get('after', {}), olr.get('after', {}),
-                                      op=lm['op'], section='after')
+        if lm.op in ('INSERT', 'UPDATE'):
+            col_diffs = columns_match(lm.after, olr.after)
             if col_diffs:
                 diffs.append(f"Record (LM#{lm_idx+1}\u2194OLR#{olr_idx+1}) "
-                             f"({lm['op']}) 'after' column diffs:")
+                             f"({lm.op}) 'after' column diffs:")
                 diffs.extend(col_diffs)
 
-        if lm['op'] in ('UPDATE', 'DELETE'):
-            col_diffs = columns_match(lm.get('before', {}), olr.get('before', {}),
-                                      op=lm['op'], section='before')
+        if lm.op in ('UPDATE', 'DELETE'):
+            col_diffs = columns_match(lm.before, olr.before)
             if col_diffs:
                 diffs.append(f"Record (LM#{lm_idx+1}\u2194OLR#{olr_idx+1}) "
-                             f"({lm['op']}) 'before' column diffs:")
+                             f"({lm.op}) 'before' column diffs:")
                 diffs.extend(col_diffs)
 
     return diffs
@@ -415,10 +490,9 @@ def main():
     logminer_path = sys.argv[1]
     olr_path = sys.argv[2]
 
-    lm_records = parse_logminer_json(logminer_path)
-    olr_records = parse_olr_json(olr_path)
-
-    lm_records = normalize_lob_operations(lm_records)
+    # compare() pairs records by index, so materialize both sides once here
+    lm_records = normalize_lob_operations(parse_logminer_json(logminer_path))
+    olr_records = list(parse_olr_json(olr_path))
 
     diffs = compare(lm_records, olr_records)
 
@@ -12,20 +12,164 @@ All column values are stored as strings for type-agnostic comparison.
 """
 
 import json
+import multiprocessing
+import os
 import re
 import sys
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The spool is read in binary and records are written out as they are
+# converted, both through a large buffer
+READ_BUFFER_SIZE = 1 << 20
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Spools at least this large are converted by a pool of worker processes,
+# CONVERT_BATCH_LINES merged lines per task; results keep input order
+PARALLEL_MIN_BYTES = 16 << 20
+CONVERT_BATCH_LINES = 2048
+
+# Statement keywords; insert/update/delete prefixes are checked by hand and
+# the clauses in between are located with the quote-aware scanners below
+VALUES_KW_RE = re.compile(r'\s+values\s+\(', re.IGNORECASE)
+SET_KW_RE = re.compile(r'\s+set\s+', re.IGNORECASE)
+WHERE_KW_RE = re.compile(r'\s+where\s+', re.IGNORECASE)
+QUOTE_RE = re.compile(r"['\"]")
+QUOTE_OR_PAREN_RE = re.compile(r"['\"()]")
+SQL_START_RE = re.compile(r'^(insert into|update|delete from)\s+"', re.IGNORECASE)
+
+# "COL" = value in a SET clause
+COLUMN_EQ_RE = re.compile(r'\s*"([^"]+)"\s*=\s*(.+)$', re.DOTALL)
+# "COL" = value or "COL" IS NULL in a WHERE clause; group 2 is None for IS NULL
+WHERE_CONDITION_RE = re.compile(r'\s*"([^"]+)"(?:\s*=\s*(\S.*)|\s+IS\s+NULL)', re.IGNORECASE | re.DOTALL)
+ASSIGN_SPLIT_RE = re.compile(r',\s*(?=")')
+# Quoted literals (running to the end if unterminated) are matched only to
+# be stepped over; group 1 is an ' and ' separator outside of them
+WHERE_SPLIT_RE = re.compile(r"""'[^']*(?:'|\Z)|"[^"]*(?:"|\Z)|(\s+and\s+)""", re.IGNORECASE)
+
+TO_DATE_RE = re.compile(r"TO_DATE\('([^']*)'", re.IGNORECASE)
+TO_TIMESTAMP_RE = re.compile(r"TO_TIMESTAMP\('([^']*)'", re.IGNORECASE)
+HEXTORAW_RE = re.compile(r"HEXTORAW\('([^']*)'\)", re.IGNORECASE)
+FUNCTION_ARG_RES = {'TO_DATE': TO_DATE_RE, 'TO_TIMESTAMP': TO_TIMESTAMP_RE, 'HEXTORAW': HEXTORAW_RE}
+
+# One token of a VALUES list after any ' '/',' separators: a quoted string
+# ('' escapes; an unterminated one runs to the end), NULL, the name of a
+# function call handled by scan_function_call, or an unquoted literal
+VALUE_TOKEN_RE = re.compile(
+    r"[ ,]*(?:'([^']*(?:''[^']*)*)'?|(NULL)|(TO_DATE|TO_TIMESTAMP|HEXTORAW)|([^, ]+))",
+    re.IGNORECASE)
+
+
+def skip_literal(s, i):
+    """Return the index just past the '...' or "..." literal opening at s[i].
+
+    A doubled quote inside a literal ('it''s') is simply two adjacent literals
+    as far as skipping is concerned."""
+    end = s.find(s[i], i + 1)
+    return len(s) if end < 0 else end + 1
+
+
+def skip_table_name(s, i):
+    """Return the index after a "OWNER"."TABLE" pair starting at s[i], or -1."""
+    if not s.startswith('"', i):
+        return -1
+    j = s.find('"', i + 1)
+    if j < 0 or not s.startswith('."', j + 1):
+        return -1
+    j = s.find('"', j + 3)
+    return -1 if j < 0 else j + 1
+
+
+def find_closing_paren(s, i):
+    """Return the index of the ')' matching the first '(' at or after s[i], or -1.
+    Parentheses inside quoted literals are ignored."""
+    depth = 0
+    pos = i
+    while True:
+        m = QUOTE_OR_PAREN_RE.search(s, pos)
+        if m is None:
+            return -1
+        j = m.start()
+        ch = s[j]
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return j
+        else:
+            pos = skip_literal(s, j)
+            continue
+        pos = j + 1
+
+
+def scan_function_call(s, i, arg_re):
+    """Parse a TO_DATE(...)-style call starting at s[i].
+
+    Returns (value, index after the call): the value is arg_re's captured
+    literal argument, or the raw remainder of s if it doesn't match."""
+    m = arg_re.match(s, i)
+    value = m.group(1) if m else s[i:]
+    end = find_closing_paren(s, i)
+    return value, (len(s) if end < 0 else end + 1)
+
+
+def find_keyword(s, keyword_re, pos):
+    """Return the first keyword_re match at or after pos outside quoted literals."""
+    n = len(s)
+    while pos < n:
+        q = QUOTE_RE.search(s, pos)
+        end = q.start() if q else n
+        m = keyword_re.search(s, pos, end)
+        if m or q is None:
+            return m
+        pos = skip_literal(s, end)
+    return None
+
+
+def split_conditions(s):
+    """Split a WHERE clause on the ' and ' separators outside quoted literals."""
+    parts = []
+    pos = 0
+    for m in WHERE_SPLIT_RE.finditer(s):
+        if m.group(1) is not None:
+            parts.append(s[pos:m.start()])
+            pos = m.end()
+    parts.append(s[pos:])
+    return parts
+
+
+def strip_statement_end(s):
+    """Drop trailing whitespace and the statement-terminating ';'."""
+    s = s.rstrip()
+    if s.endswith(';'):
+        s = s[:-1].rstrip()
+    return s
 
 
 def parse_insert(sql_redo):
     """Parse: insert into "OWNER"."TABLE"("COL1","COL2",...) values ('v1','v2',...)"""
-    m = re.match(
-        r'insert into "[^"]*"\."[^"]*"\((.+?)\)\s+values\s+\((.+)\)\s*;?\s*$',
-        sql_redo, re.IGNORECASE | re.DOTALL
-    )
+    if sql_redo[:12].lower() != 'insert into ':
+        return None
+    i = skip_table_name(sql_redo, 12)
+    if i < 0 or not sql_redo.startswith('(', i):
+        return None
+    cols_end = find_closing_paren(sql_redo, i)
+    if cols_end < 0:
+        return None
+    m = VALUES_KW_RE.match(sql_redo, cols_end + 1)
     if not m:
         return None
-    cols = parse_column_list(m.group(1))
-    vals = parse_value_list(m.group(2))
+    vals_start = m.end() - 1
+    vals_end = find_closing_paren(sql_redo, vals_start)
+    if vals_end < 0 or strip_statement_end(sql_redo[vals_end + 1:]):
+        return None
+    cols = parse_column_list(sql_redo[i + 1:cols_end])
+    vals = parse_value_list(sql_redo[vals_start + 1:vals_end])
     if len(cols) != len(vals):
         return None
     return {"after": dict(zip(cols, vals))}
@@ -33,136 +177,75 @@ def parse_insert(sql_redo):
 
 def parse_update(sql_redo):
     """Parse: update "OWNER"."TABLE" set "COL1" = 'v1', ... where "COL2" = 'v2' and ..."""
-    m = re.match(
-        r'update "[^"]*"\."[^"]*"\s+set\s+(.+?)\s+where\s+(.+)\s*;?\s*$',
-        sql_redo, re.IGNORECASE | re.DOTALL
-    )
+    if sql_redo[:7].lower() != 'update ':
+        return None
+    i = skip_table_name(sql_redo, 7)
+    m = SET_KW_RE.match(sql_redo, i) if i >= 0 else None
     if not m:
         return None
-    after = parse_assignments(m.group(1))
-    before = parse_where_clause(m.group(2))
-    return {"before": before, "after": after}
+    w = find_keyword(sql_redo, WHERE_KW_RE, m.end())
+    if w is None:
+        return None
+    after = parse_assignments(sql_redo[m.end():w.start()])
+    before = parse_where_clause(strip_statement_end(sql_redo[w.end():]))
+    return {"after": after, "before": before}
 
 
 def parse_delete(sql_redo):
     """Parse: delete from "OWNER"."TABLE" where "COL1" = 'v1' and ..."""
-    m = re.match(
-        r'delete from "[^"]*"\."[^"]*"\s+where\s+(.+)\s*;?\s*$',
-        sql_redo, re.IGNORECASE | re.DOTALL
-    )
+    if sql_redo[:12].lower() != 'delete from ':
+        return None
+    i = skip_table_name(sql_redo, 12)
+    m = WHERE_KW_RE.match(sql_redo, i) if i >= 0 else None
     if not m:
         return None
-    before = parse_where_clause(m.group(1))
+    before = parse_where_clause(strip_statement_end(sql_redo[m.end():]))
     return {"before": before}
 
 
 def parse_column_list(s):
-    """Parse quoted column names: "COL1","COL2",... """
-    return re.findall(r'"([^"]+)"', s)
+    """Parse quoted column names: "COL1","COL2",...
+
+    Oracle identifiers cannot contain '"', so every other piece between
+    the quotes is a name."""
+    return [sys.intern(name) for name in s.split('"')[1::2]]
 
 
 def parse_value_list(s):
     """Parse values: 'v1','v2',NULL,TO_DATE(...),... """
     values = []
     i = 0
-    while i < len(s):
-        c = s[i]
-        if c in (' ', ','):
-            i += 1
-            continue
-        if c == "'":
-            # Quoted string — handle escaped quotes ('')
-            j = i + 1
-            val = []
-            while j < len(s):
-                if s[j] == "'" and j + 1 < len(s) and s[j + 1] == "'":
-                    val.append("'")
-                    j += 2
-                elif s[j] == "'":
-                    j += 1
-                    break
-                else:
-                    val.append(s[j])
-                    j += 1
-            values.append("".join(val))
-            i = j
-        elif s[i:i+4].upper() == 'NULL':
+    n = len(s)
+    while i < n:
+        m = VALUE_TOKEN_RE.match(s, i)
+        if m is None:
+            # Nothing but separators left
+            break
+        quoted, null, func, literal = m.groups()
+        if quoted is not None:
+            values.append(quoted.replace("''", "'"))
+        elif null is not None:
             values.append(None)
-            i += 4
-        elif s[i:i+7].upper() == 'TO_DATE':
-            # TO_DATE('...','...') — extract the date string
-            m = re.match(r"TO_DATE\('([^']*)'", s[i:], re.IGNORECASE)
-            if m:
-                values.append(m.group(1))
-            else:
-                values.append(s[i:])
-            # Skip to matching closing paren
-            depth = 0
-            while i < len(s):
-                if s[i] == '(':
-                    depth += 1
-                elif s[i] == ')':
-                    depth -= 1
-                    if depth == 0:
-                        i += 1
-                        break
-                i += 1
-        elif s[i:i+12].upper() == 'TO_TIMESTAMP':
-            m = re.match(r"TO_TIMESTAMP\('([^']*)'", s[i:], re.IGNORECASE)
-            if m:
-                values.append(m.group(1))
-            else:
-                values.append(s[i:])
-            depth = 0
-            while i < len(s):
-                if s[i] == '(':
-                    depth += 1
-                elif s[i] == ')':
-                    depth -= 1
-                    if depth == 0:
-                        i += 1
-                        break
-                i += 1
-        elif s[i:i+8].upper() == 'HEXTORAW':
-            m = re.match(r"HEXTORAW\('([^']*)'\)", s[i:], re.IGNORECASE)
-            if m:
-                values.append(m.group(1))
-            else:
-                values.append(s[i:])
-            depth = 0
-            while i < len(s):
-                if s[i] == '(':
-                    depth += 1
-                elif s[i] == ')':
-                    depth -= 1
-                    if depth == 0:
-                        i += 1
-                        break
-                i += 1
+        elif func is not None:
+            # TO_DATE('...','...') etc. — extract the literal argument
+            val, i = scan_function_call(s, m.start(3), FUNCTION_ARG_RES[func.upper()])
+            values.append(val)
+            continue
         else:
             # Unquoted number or other literal
-            j = i
-            while j < len(s) and s[j] not in (',', ' '):
-                j += 1
-            if j == i:
-                # Skip unrecognized character to avoid infinite loop
-                i += 1
-                continue
-            values.append(s[i:j])
-            i = j
+            values.append(literal)
+        i = m.end()
     return values
 
 
 def parse_assignments(s):
     """Parse SET clause: "COL1" = 'v1', "COL2" = 'v2', ..."""
     result = {}
-    # Match "COL" = value patterns
-    pattern = r'"([^"]+)"\s*=\s*'
-    parts = re.split(r',\s*(?=")', s)
+    parts = ASSIGN_SPLIT_RE.split(s)
     for part in parts:
-        m = re.match(r'\s*"([^"]+)"\s*=\s*(.+)$', part.strip(), re.DOTALL)
+        m = COLUMN_EQ_RE.match(part.strip())
         if m:
-            col = m.group(1)
+            col = sys.intern(m.group(1))
             val_str = m.group(2).strip()
             result[col] = extract_value(val_str)
     return result
@@ -172,17 +255,12 @@ def parse_where_clause(s):
     """Parse WHERE clause: "COL1" = 'v1' and "COL2" = 'v2' and ..."""
     result = {}
     # Split on ' and ' (case-insensitive) but not within quotes
-    parts = re.split(r'\s+and\s+', s, flags=re.IGNORECASE)
+    parts = split_conditions(s)
     for part in parts:
-        m = re.match(r'\s*"([^"]+)"\s*=\s*(.+)$', part.strip(), re.DOTALL)
+        m = WHERE_CONDITION_RE.match(part)
         if m:
-            col = m.group(1)
-            val_str = m.group(2).strip()
-            result[col] = extract_value(val_str)
-        # Handle IS NULL
-        m2 = re.match(r'\s*"([^"]+)"\s+IS\s+NULL', part.strip(), re.IGNORECASE)
-        if m2:
-            result[m2.group(1)] = None
+            col, val_str = m.groups()
+            result[sys.intern(col)] = None if val_str is None else extract_value(val_str.strip())
     return result
 
 
@@ -194,13 +272,13 @@ def extract_value(val_str):
     if val_str.startswith("'") and val_str.endswith("'"):
         # Unescape ''
         return val_str[1:-1].replace("''", "'")
-    m = re.match(r"TO_DATE\('([^']*)'", val_str, re.IGNORECASE)
+    m = TO_DATE_RE.match(val_str)
     if m:
         return m.group(1)
-    m = re.match(r"TO_TIMESTAMP\('([^']*)'", val_str, re.IGNORECASE)
+    m = TO_TIMESTAMP_RE.match(val_str)
     if m:
         return m.group(1)
-    m = re.match(r"HEXTORAW\('([^']*)'\)", val_str, re.IGNORECASE)
+    m = HEXTORAW_RE.match(val_str)
     if m:
         return m.group(1)
     return val_str
@@ -212,18 +290,11 @@ def convert_line(line):
     if len(parts) < 7:
         return None
 
+    # The spool query concatenates the columns with '|' so the header fields
+    # carry no padding; the line itself was stripped when it was read
     scn, operation, seg_owner, table_name, xid, sql_redo, sql_undo = parts
-    operation = operation.strip()
     sql_redo = sql_redo.strip()
 
-    record = {
-        "scn": scn.strip(),
-        "op": operation,
-        "owner": seg_owner.strip(),
-        "table": table_name.strip(),
-        "xid": xid.strip(),
-    }
-
     if operation == 'INSERT':
         parsed = parse_insert(sql_redo)
     elif operation == 'UPDATE':
@@ -235,15 +306,18 @@ def convert_line(line):
 
     if parsed is None:
         print(f"WARNING: Failed to parse SQL_REDO: {sql_redo}", file=sys.stderr)
-        record["after"] = {}
-        record["before"] = {}
-        return record
-
-    record.update(parsed)
-    return record
-
-
-SQL_START_RE = re.compile(r'^(insert into|update|delete from)\s+"', re.IGNORECASE)
+        parsed = {"after": {}, "before": {}}
+
+    # Keys go in sorted order (after, before, then the header fields) so
+    # records serialize canonically without sort_keys
+    return {
+        **parsed,
+        "op": sys.intern(operation),
+        "owner": sys.intern(seg_owner),
+        "scn": scn,
+        "table": sys.intern(table_name),
+        "xid": xid,
+    }
 
 
 def merge_continuation_lines(lines):
@@ -252,8 +326,8 @@ def merge_continuation_lines(lines):
     When SQL_REDO exceeds ~4000 chars, LogMiner splits it across multiple rows
     with the same scn|op|owner|table|xid prefix. Continuation rows have sql_redo
     that doesn't start with an SQL keyword (insert/update/delete).
+    Each merged line is yielded once the next statement starts.
     """
-    merged = []
     accum = None  # (header_parts[0:5], sql_redo, sql_undo)
     for line in lines:
         parts = line.split('|', 6)
@@ -265,44 +339,87 @@ def merge_continuation_lines(lines):
             accum = (accum[0], accum[1] + sql_redo, accum[2] + sql_undo)
         else:
             if accum:
-                merged.append('|'.join(accum[0]) + '|' + accum[1] + '|' + accum[2])
+                yield '|'.join(accum[0]) + '|' + accum[1] + '|' + accum[2]
             accum = (parts[:5], sql_redo, sql_undo)
     if accum:
-        merged.append('|'.join(accum[0]) + '|' + accum[1] + '|' + accum[2])
-    return merged
+        yield '|'.join(accum[0]) + '|' + accum[1] + '|' + accum[2]
 
 
-def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <logminer-output-file> [output-file]", file=sys.stderr)
-        sys.exit(1)
+def read_spool_lines(f):
+    """Yield the stripped data lines of a binary spool file, skipping SQL*Plus noise.
+
+    Lines are filtered as bytes and only decoded if they are kept."""
+    for line in f:
+        line = line.strip()
+        if not line or line.startswith((b'--', b'SQL>')):
+            continue
+        yield line.decode('utf-8', 'replace')
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
 
-    raw_lines = []
-    with open(input_file) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('--') or line.startswith('SQL>'):
-                continue
-            raw_lines.append(line)
+def json_dumps(record):
+    """Encode one record as a JSON line (bytes), using orjson when it is available.
 
-    merged_lines = merge_continuation_lines(raw_lines)
+    Keys are written in the order convert_line inserted them. The stdlib
+    fallback is set up to produce the same bytes as orjson."""
+    if orjson is None:
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+        return (line + '\n').encode('utf-8')
+    return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
 
-    records = []
-    for line in merged_lines:
+
+def convert_batch(lines):
+    """Convert a batch of merged spool lines to their JSON lines, joined."""
+    out = []
+    for line in lines:
         rec = convert_line(line)
         if rec:
-            records.append(rec)
+            out.append(json_dumps(rec))
+    return b''.join(out)
+
 
-    output = '\n'.join(json.dumps(r, sort_keys=True) for r in records) + '\n'
+def batched(iterable, n):
+    """Yield lists of up to n items from iterable."""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, n))
+        if not batch:
+            return
+        yield batch
 
-    if output_file:
-        with open(output_file, 'w') as f:
-            f.write(output)
+
+def write_records(lines, out, processes=1):
+    """Convert spool lines and write one JSON record per line to the binary stream out.
+
+    With processes > 1 the conversion is spread over a forked worker pool."""
+    batches = batched(merge_continuation_lines(lines), CONVERT_BATCH_LINES)
+    if processes > 1:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            for chunk in pool.imap(convert_batch, batches):
+                out.write(chunk)
     else:
-        sys.stdout.write(output)
+        for batch in batches:
+            out.write(convert_batch(batch))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} <logminer-output-file> [output-file]", file=sys.stderr)
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+
+    processes = 1
+    if os.path.getsize(input_file) >= PARALLEL_MIN_BYTES:
+        processes = os.cpu_count() or 1
+
+    with open(input_file, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        lines = read_spool_lines(f)
+        if output_file:
+            with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+                write_records(lines, out, processes)
+        else:
+            write_records(lines, sys.stdout.buffer, processes)
 
 
 if __name__ == '__main__':